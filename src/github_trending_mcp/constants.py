@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 # 策划后的语言列表，过滤掉不常用或噪声较大的语言，方便前端展示。
-CURATED_LANGUAGES: list[str] = [
+CURATED_LANGUAGES: tuple[str, ...] = (
     "all",
     "python",
     "javascript",
@@ -28,10 +28,14 @@ CURATED_LANGUAGES: list[str] = [
     "r",
     "perl",
     "objective-c",
-]
+)
+# 供成员判断使用的集合版本，避免每次校验都线性扫描元组。
+CURATED_LANGUAGES_SET: frozenset[str] = frozenset(CURATED_LANGUAGES)
 
 # 支持的时间窗口
 SUPPORTED_TIMEFRAMES: tuple[str, ...] = ("daily", "weekly", "monthly")
+# 时间窗口的集合版本，供成员判断使用
+SUPPORTED_TIMEFRAMES_SET: frozenset[str] = frozenset(SUPPORTED_TIMEFRAMES)
 # 默认时间窗口
 DEFAULT_TIMEFRAME = "daily"
 # 默认返回数量
@@ -42,5 +46,26 @@ MAX_LIMIT = 100
 GITHUB_TRENDING_URL = "https://github.com/trending"
 # GitHub REST API 入口
 GITHUB_API_URL = "https://api.github.com"
+# GitHub GraphQL API 入口，批量补全仓库元数据时使用（需要 token）
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+# 单个 GraphQL 查询中最多包含的仓库数，避免查询过大被拒绝
+GRAPHQL_BATCH_SIZE = 50
 # 统一的 User-Agent，友好表明来源
 USER_AGENT = "GitHub-Trending-MCP/0.1 (+https://github.com)"
+# 并发补全仓库元数据时的线程数，兼顾速度与 GitHub 的并发限制
+API_MAX_WORKERS = 8
+# HTTP 会话的连接池大小，需不小于并发线程数以复用连接
+HTTP_POOL_SIZE = 32
+# 遇到 502/503/504 等瞬时错误时的重试次数与退避系数
+HTTP_MAX_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.3
+# Trending 页面 HTML 缓存的有效期（秒）与容量，页面内容通常以分钟级变化
+PAGE_CACHE_TTL = 600
+PAGE_CACHE_SIZE = 128
+# 仓库元数据缓存的有效期（秒）与容量，元数据变化更慢
+REPO_CACHE_TTL = 1800
+REPO_CACHE_SIZE = 4096
+# GitHub API 剩余配额低于该值时暂停请求，等待配额重置
+RATE_LIMIT_MIN_REMAINING = 5
+# 因限流等待的最长秒数，超过则放弃本次补全而不是长时间阻塞请求
+RATE_LIMIT_MAX_WAIT = 60
@@ -2,25 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import threading
 import time
-from collections import OrderedDict
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
+import httpx
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 from urllib.parse import quote
 
 from .constants import (
-    CURATED_LANGUAGES,
+    API_MAX_WORKERS,
+    CURATED_LANGUAGES_SET,
     DEFAULT_LIMIT,
     DEFAULT_TIMEFRAME,
     GITHUB_API_URL,
+    GITHUB_GRAPHQL_URL,
     GITHUB_TRENDING_URL,
+    GRAPHQL_BATCH_SIZE,
+    HTTP_MAX_RETRIES,
+    HTTP_POOL_SIZE,
+    HTTP_RETRY_BACKOFF,
     MAX_LIMIT,
+    PAGE_CACHE_SIZE,
+    PAGE_CACHE_TTL,
+    RATE_LIMIT_MAX_WAIT,
+    RATE_LIMIT_MIN_REMAINING,
+    REPO_CACHE_SIZE,
+    REPO_CACHE_TTL,
     SUPPORTED_TIMEFRAMES,
+    SUPPORTED_TIMEFRAMES_SET,
     USER_AGENT,
 )
 from .models import RepoMetadata, TrendingHTMLRow, TrendingRepository, TrendingRequest, TrendingResponse
@@ -28,6 +49,12 @@ from .utils import parse_int
 
 logger = logging.getLogger(__name__)
 
+# 进程级缓存：HTTP 端每个请求都会新建 service，缓存放在模块级才能跨请求命中。
+_PAGE_CACHE: "TTLCache[tuple, bytes]" = TTLCache(maxsize=PAGE_CACHE_SIZE, ttl=PAGE_CACHE_TTL)
+_REPO_CACHE: "TTLCache[str, RepoMetadata]" = TTLCache(maxsize=REPO_CACHE_SIZE, ttl=REPO_CACHE_TTL)
+# TTLCache 本身不是线程安全的，线程池并发补全时需加锁。
+_CACHE_LOCK = threading.Lock()
+
 
 @dataclass(slots=True)
 class FetchContext:
@@ -38,29 +65,395 @@ class FetchContext:
     limit: int
 
 
-class GitHubAPIClient:
+@dataclass(slots=True)
+class FetchPlan:
+    """一次抓取的配额规划结果，以及去重后待补全的 Trending 行。"""
+
+    timeframe: str
+    normalized_languages: List[str]
+    languages_to_fetch: List[Optional[str]]
+    requested_limit: int
+    per_language_limit: int
+    is_all_mode: bool
+    intended_total: int
+    overall_limit: int
+    rows: List[TrendingHTMLRow] = field(default_factory=list)
+
+
+class RateLimitState:
+    """记录 GitHub API 的剩余配额，让并发的补全请求一起退避。"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._remaining: Optional[int] = None
+        self._reset_at = 0.0
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """根据响应头中的 X-RateLimit-* 更新配额。"""
+        remaining = parse_int(headers.get("X-RateLimit-Remaining"))
+        if remaining is None:
+            return
+        reset = parse_int(headers.get("X-RateLimit-Reset"))
+        with self._lock:
+            self._remaining = remaining
+            if reset:
+                self._reset_at = float(reset)
+
+    def delay(self) -> float:
+        """配额即将耗尽时返回距离重置的秒数，否则返回 0。"""
+        with self._lock:
+            if self._remaining is None or self._remaining >= RATE_LIMIT_MIN_REMAINING:
+                return 0.0
+            return max(0.0, self._reset_at - time.time())
+
+
+def _retry_after(status_code: int, headers: Mapping[str, str]) -> Optional[float]:
+    """解析 403/429 限流响应需要等待的秒数，非限流响应返回 None。"""
+    if status_code not in (403, 429):
+        return None
+    retry_after = parse_int(headers.get("Retry-After"))
+    if retry_after is not None:
+        return float(retry_after)
+    if headers.get("X-RateLimit-Remaining") == "0":
+        reset = parse_int(headers.get("X-RateLimit-Reset"))
+        if reset:
+            return max(0.0, reset - time.time())
+    return None
+
+
+# 同步会话与异步客户端都会对这些瞬时错误状态码重试。
+_RETRY_STATUSES = (502, 503, 504)
+
+
+def _build_session(headers: Mapping[str, str]) -> requests.Session:
+    """创建带连接池与瞬时错误重试的会话，页面与 API 客户端共用同一配置。"""
+    session = requests.Session()
+    session.headers.update(headers)
+    retry = Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+        # 限流响应的 Retry-After 交给 fetch_repo 处理（只重试一次且有等待上限），
+        # 否则 urllib3 会对带该响应头的 429/503 按原值无上限地睡眠重试。
+        respect_retry_after_header=False,
+    )
+    # 并发请求时默认 10 个连接的池子会被挤爆，多出的连接用完即弃、下次重新握手。
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+# GraphQL 中与 REST 元数据对应的字段。
+_GRAPHQL_REPO_FIELDS = "description stargazerCount forkCount pushedAt updatedAt url defaultBranchRef { name }"
+
+
+def _build_batch_query(pairs: List[Tuple[str, str]]) -> Tuple[str, Dict[str, str]]:
+    """为一批仓库构造带别名的 GraphQL 查询，owner/name 通过变量传入而非拼接到查询中。"""
+    params: List[str] = []
+    fields: List[str] = []
+    variables: Dict[str, str] = {}
+    for idx, (owner, name) in enumerate(pairs):
+        params.append(f"$o{idx}: String!, $n{idx}: String!")
+        fields.append(f"r{idx}: repository(owner: $o{idx}, name: $n{idx}) {{ {_GRAPHQL_REPO_FIELDS} }}")
+        variables[f"o{idx}"] = owner
+        variables[f"n{idx}"] = name
+    return f"query({', '.join(params)}) {{ {' '.join(fields)} }}", variables
+
+
+def _parse_batch_response(
+    pairs: List[Tuple[str, str]],
+    payload: Dict[str, Any],
+) -> Dict[str, Optional[RepoMetadata]]:
+    """把 GraphQL 响应按别名还原为 {owner/name: RepoMetadata}，不存在的仓库为 None。"""
+    data = payload.get("data")
+    if not isinstance(data, dict):
+        logger.warning("GitHub GraphQL 批量查询失败：%s", payload.get("errors"))
+        return {}
+    results: Dict[str, Optional[RepoMetadata]] = {}
+    for idx, (owner, name) in enumerate(pairs):
+        repo = data.get(f"r{idx}")
+        metadata = None
+        if repo:
+            default_branch = repo.get("defaultBranchRef") or {}
+            metadata = RepoMetadata(
+                description=repo.get("description"),
+                stargazers_count=repo.get("stargazerCount"),
+                forks_count=repo.get("forkCount"),
+                updated_at=repo.get("pushedAt") or repo.get("updatedAt"),
+                html_url=repo.get("url"),
+                default_branch=default_branch.get("name"),
+            )
+        results[f"{owner}/{name}".lower()] = metadata
+    return results
+
+
+# 同一进程共用一个 token，配额状态也在所有客户端之间共享。
+_RATE_LIMIT = RateLimitState()
+
+
+def _cache_get(cache: TTLCache, key: Any) -> Any:
+    """加锁读取模块级缓存，未命中返回 None。"""
+    with _CACHE_LOCK:
+        return cache.get(key)
+
+
+def _cache_put(cache: TTLCache, key: Any, value: Any) -> None:
+    """加锁写入模块级缓存。"""
+    with _CACHE_LOCK:
+        cache[key] = value
+
+
+class _RetryingAsyncTransport(httpx.AsyncHTTPTransport):
+    """与 _build_session 的 urllib3 Retry 对齐：GET 遇到 502/503/504 时按指数退避重试。
+
+    连接失败的重试由 httpx 自带的 retries 参数处理。
+    """
+
+    def __init__(self) -> None:
+        super().__init__(http2=True, retries=HTTP_MAX_RETRIES)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(HTTP_MAX_RETRIES):
+            response = await super().handle_async_request(request)
+            if request.method != "GET" or response.status_code not in _RETRY_STATUSES:
+                return response
+            await response.aclose()
+            # 与 urllib3 相同：第一次重试立即进行，之后按 backoff_factor * 2^n 递增。
+            if attempt:
+                await asyncio.sleep(HTTP_RETRY_BACKOFF * (2**attempt))
+        return await super().handle_async_request(request)
+
+
+def _build_async_client(headers: Mapping[str, str], timeout: float) -> httpx.AsyncClient:
+    """创建 HTTP/2 异步客户端，页面与 API 客户端共用同一配置。"""
+    return httpx.AsyncClient(
+        transport=_RetryingAsyncTransport(),
+        headers=dict(headers),
+        timeout=timeout,
+        follow_redirects=True,
+    )
+
+
+class _HTTPClientBase:
+    """同步会话与异步客户端的公共管理逻辑。"""
+
+    def __init__(self, headers: Dict[str, str], timeout: int) -> None:
+        self.headers = headers
+        self.session = _build_session(self.headers)
+        self.timeout = timeout
+        # 异步客户端绑定创建时的事件循环，因此按需懒加载而非在构造时创建。
+        self._async_client: Optional[httpx.AsyncClient] = None
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """返回可复用的 HTTP/2 异步客户端，已关闭时重新创建。"""
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = _build_async_client(self.headers, self.timeout)
+        return self._async_client
+
+    def close(self) -> None:
+        """关闭同步 HTTP 会话。"""
+        self.session.close()
+
+    async def aclose(self) -> None:
+        """关闭异步客户端与同步会话。"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.close()
+
+
+class GitHubAPIClient(_HTTPClientBase):
     """GitHub REST API 的轻量封装，按需拉取仓库元数据。"""
 
     def __init__(self, token: Optional[str] = None, timeout: int = 20) -> None:
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": USER_AGENT})
+        headers = {"User-Agent": USER_AGENT}
         if token:
-            self.session.headers["Authorization"] = f"Bearer {token}"
-        self.timeout = timeout
+            headers["Authorization"] = f"Bearer {token}"
+        super().__init__(headers, timeout)
+        self._has_token = bool(token)
 
     def fetch_repo(self, owner: str, name: str) -> Optional[RepoMetadata]:
         """根据 owner/name 调用 REST API，失败时返回 None。"""
+        cache_key = f"{owner}/{name}".lower()
+        cached = _cache_get(_REPO_CACHE, cache_key)
+        if cached is not None:
+            return cached
         url = f"{GITHUB_API_URL}/repos/{owner}/{name}"
         logger.debug("开始拉取仓库详情：%s", url)
-        try:
-            response = self.session.get(url, timeout=self.timeout)
-        except requests.exceptions.RequestException as exc:
-            logger.error("请求 GitHub API 时发生异常 %s/%s：%s", owner, name, exc)
+        # 最多请求两次：首次遇到带 Retry-After 的限流响应时等待后重试一次。
+        for attempt in range(2):
+            delay = self._quota_delay(owner, name)
+            if delay is None:
+                return None
+            if delay:
+                time.sleep(delay)
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+            except requests.exceptions.RequestException as exc:
+                logger.error("请求 GitHub API 时发生异常 %s/%s：%s", owner, name, exc)
+                return None
+            wait = self._retry_wait(attempt, response, owner, name)
+            if wait is None:
+                break
+            time.sleep(wait)
+        return self._handle_repo_response(cache_key, response, owner, name)
+
+    async def fetch_repo_async(self, owner: str, name: str) -> Optional[RepoMetadata]:
+        """fetch_repo 的异步版本，经 HTTP/2 多路复用同一条连接，失败时返回 None。"""
+        cache_key = f"{owner}/{name}".lower()
+        cached = _cache_get(_REPO_CACHE, cache_key)
+        if cached is not None:
+            return cached
+        url = f"{GITHUB_API_URL}/repos/{owner}/{name}"
+        logger.debug("开始异步拉取仓库详情：%s", url)
+        for attempt in range(2):
+            delay = self._quota_delay(owner, name)
+            if delay is None:
+                return None
+            if delay:
+                await asyncio.sleep(delay)
+            try:
+                response = await self._get_async_client().get(url)
+            except httpx.HTTPError as exc:
+                logger.error("请求 GitHub API 时发生异常 %s/%s：%s", owner, name, exc)
+                return None
+            wait = self._retry_wait(attempt, response, owner, name)
+            if wait is None:
+                break
+            await asyncio.sleep(wait)
+        return self._handle_repo_response(cache_key, response, owner, name)
+
+    def fetch_repos_batch(self, pairs: List[Tuple[str, str]]) -> Dict[str, Optional[RepoMetadata]]:
+        """用 GraphQL 一次请求补全一批仓库，结果以小写 owner/name 为键。
+
+        GraphQL 必须携带 token；未配置 token 或请求失败时，对应仓库不会出现在结果中，由调用方回退到 REST。
+        """
+        results, pending = self._split_cached(pairs)
+        if not self._has_token:
+            return results
+        for chunk, body in self._batch_requests(pending):
+            try:
+                response = self.session.post(GITHUB_GRAPHQL_URL, json=body, timeout=self.timeout)
+            except requests.exceptions.RequestException as exc:
+                logger.error("请求 GitHub GraphQL 时发生异常：%s", exc)
+                continue
+            results.update(self._handle_batch_response(chunk, response))
+        return results
+
+    async def fetch_repos_batch_async(self, pairs: List[Tuple[str, str]]) -> Dict[str, Optional[RepoMetadata]]:
+        """fetch_repos_batch 的异步版本。"""
+        results, pending = self._split_cached(pairs)
+        if not self._has_token:
+            return results
+        for chunk, body in self._batch_requests(pending):
+            try:
+                response = await self._get_async_client().post(GITHUB_GRAPHQL_URL, json=body)
+            except httpx.HTTPError as exc:
+                logger.error("请求 GitHub GraphQL 时发生异常：%s", exc)
+                continue
+            results.update(self._handle_batch_response(chunk, response))
+        return results
+
+    # 以下辅助方法不涉及 IO，同步与异步两条路径共用，限流与缓存策略只需维护一处。
+
+    @staticmethod
+    def _quota_delay(owner: str, name: str) -> Optional[float]:
+        """请求前按共享配额计算需要等待的秒数；等待超过上限时返回 None 表示放弃。"""
+        delay = _RATE_LIMIT.delay()
+        if delay > RATE_LIMIT_MAX_WAIT:
+            logger.warning("GitHub API 配额不足，%.0f 秒后才会重置，跳过 %s/%s", delay, owner, name)
+            return None
+        return delay
+
+    @staticmethod
+    def _retry_wait(attempt: int, response: Any, owner: str, name: str) -> Optional[float]:
+        """记录配额并判断是否重试：返回重试前的等待秒数，不需要重试时返回 None。"""
+        _RATE_LIMIT.update(response.headers)
+        wait = _retry_after(response.status_code, response.headers)
+        if attempt or wait is None or wait > RATE_LIMIT_MAX_WAIT:
             return None
+        logger.warning("GitHub API 限流 %s/%s，%.0f 秒后重试", owner, name, wait)
+        return wait
+
+    def _handle_repo_response(
+        self,
+        cache_key: str,
+        response: Any,
+        owner: str,
+        name: str,
+    ) -> Optional[RepoMetadata]:
+        """解析 REST 响应并写入缓存，非 200 响应返回 None。"""
         if response.status_code != 200:
             logger.warning("请求 GitHub API 失败 %s/%s，状态码：%s", owner, name, response.status_code)
             return None
-        data = response.json()
+        metadata = self._build_metadata(orjson.loads(response.content))
+        _cache_put(_REPO_CACHE, cache_key, metadata)
+        return metadata
+
+    @staticmethod
+    def _batch_requests(
+        pending: List[Tuple[str, str]],
+    ) -> Iterator[Tuple[List[Tuple[str, str]], Dict[str, Any]]]:
+        """按 GRAPHQL_BATCH_SIZE 分批，逐批生成 (仓库列表, 请求体)。"""
+        for start in range(0, len(pending), GRAPHQL_BATCH_SIZE):
+            chunk = pending[start : start + GRAPHQL_BATCH_SIZE]
+            query, variables = _build_batch_query(chunk)
+            yield chunk, {"query": query, "variables": variables}
+
+    def _handle_batch_response(
+        self,
+        chunk: List[Tuple[str, str]],
+        response: Any,
+    ) -> Dict[str, Optional[RepoMetadata]]:
+        """解析一批 GraphQL 响应；非 200 或无法解析时返回空字典，由调用方回退到 REST。"""
+        # GraphQL 与 REST 共用同一 token 的配额，批量接口的剩余额度同样计入共享状态。
+        _RATE_LIMIT.update(response.headers)
+        if response.status_code != 200:
+            logger.warning("请求 GitHub GraphQL 失败，状态码：%s", response.status_code)
+            return {}
+        try:
+            payload = orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:
+            logger.warning("GitHub GraphQL 响应不是合法 JSON：%s", exc)
+            return {}
+        if not isinstance(payload, dict):
+            logger.warning("GitHub GraphQL 响应格式异常：%s", type(payload).__name__)
+            return {}
+        return self._store_batch(chunk, payload)
+
+    @staticmethod
+    def _split_cached(
+        pairs: List[Tuple[str, str]],
+    ) -> Tuple[Dict[str, Optional[RepoMetadata]], List[Tuple[str, str]]]:
+        """把已缓存的仓库直接放入结果，其余留待查询。"""
+        results: Dict[str, Optional[RepoMetadata]] = {}
+        pending: List[Tuple[str, str]] = []
+        with _CACHE_LOCK:
+            for owner, name in pairs:
+                cached = _REPO_CACHE.get(f"{owner}/{name}".lower())
+                if cached is not None:
+                    results[f"{owner}/{name}".lower()] = cached
+                else:
+                    pending.append((owner, name))
+        return results, pending
+
+    @staticmethod
+    def _store_batch(
+        pairs: List[Tuple[str, str]],
+        payload: Dict[str, Any],
+    ) -> Dict[str, Optional[RepoMetadata]]:
+        """解析批量响应并写入缓存。"""
+        parsed = _parse_batch_response(pairs, payload)
+        with _CACHE_LOCK:
+            for key, metadata in parsed.items():
+                if metadata is not None:
+                    _REPO_CACHE[key] = metadata
+        return parsed
+
+    @staticmethod
+    def _build_metadata(data: Dict[str, Any]) -> RepoMetadata:
+        """把 REST API 的仓库 JSON 转换为 RepoMetadata。"""
         return RepoMetadata(
             description=data.get("description"),
             stargazers_count=data.get("stargazers_count"),
@@ -70,18 +463,48 @@ class GitHubAPIClient:
             default_branch=data.get("default_branch"),
         )
 
-    def close(self) -> None:
-        """释放会话资源。"""
-        self.session.close()
 
+# Trending 卡片内各字段的 CSS 选择器。每个选择器只在整页上执行一次再按卡片归组，
+# 避免逐行调用 css_first 时 Lexbor 反复编译同一选择器。
+_ROW_SELECTOR = "article.Box-row"
+_HEADER_SELECTOR = f"{_ROW_SELECTOR} h2.h3 a"
+_DESCRIPTION_SELECTOR = f"{_ROW_SELECTOR} p"
+_LANGUAGE_SELECTOR = f'{_ROW_SELECTOR} [itemprop="programmingLanguage"]'
+_STATS_SELECTOR = f"{_ROW_SELECTOR} a.Link--muted"
+# fork 链接在新旧页面中分别指向 /forks 与 /network/members。
+_FORK_HREF_SUFFIXES = ("/forks", "/network/members")
+_DELTA_SELECTORS = (
+    f"{_ROW_SELECTOR} span.d-inline-block.float-sm-right",
+    f"{_ROW_SELECTOR} span.color-fg-muted.text-normal",
+)
+
+
+def _owning_row_id(node: Optional[LexborNode]) -> Optional[int]:
+    """向上查找节点所属的 article 卡片，返回其 mem_id 作为归组键。"""
+    while node is not None and node.tag != "article":
+        node = node.parent
+    return node.mem_id if node is not None else None
+
+
+def _group_by_row(nodes: Iterable[LexborNode]) -> Dict[Optional[int], List[LexborNode]]:
+    """按所属卡片归组，组内保持文档顺序。"""
+    grouped: Dict[Optional[int], List[LexborNode]] = {}
+    for node in nodes:
+        grouped.setdefault(_owning_row_id(node), []).append(node)
+    return grouped
 
-class TrendingPageClient:
+
+def _first(grouped: Dict[Optional[int], List[LexborNode]], row_id: int) -> Optional[LexborNode]:
+    """取某张卡片内的第一个匹配节点，等价于逐行 css_first。"""
+    nodes = grouped.get(row_id)
+    return nodes[0] if nodes else None
+
+
+class TrendingPageClient(_HTTPClientBase):
     """负责抓取 Trending 页面 HTML，并解析为结构化结果。"""
 
     def __init__(self, timeout: int = 20) -> None:
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": USER_AGENT})
-        self.timeout = timeout
+        super().__init__({"User-Agent": USER_AGENT}, timeout)
 
     def _build_url(self, language: Optional[str], timeframe: str) -> str:
         """根据语言/时间范围生成 Trending 页面 URL。"""
@@ -91,47 +514,90 @@ class TrendingPageClient:
             return f"{GITHUB_TRENDING_URL}/{slug}?since={timeframe}"
         return f"{GITHUB_TRENDING_URL}?since={timeframe}"
 
+    @staticmethod
+    def _cache_key(language: Optional[str], timeframe: str) -> Tuple[str, str]:
+        """页面缓存键：去空白的语言与时间窗口。"""
+        return (language or "").strip(), timeframe
+
+    @staticmethod
+    def _request_error(url: str, exc: Exception) -> RuntimeError:
+        """记录页面请求失败并转换为统一的 RuntimeError，由调用方 raise。"""
+        logger.error("请求 Trending 页面失败 %s：%s", url, exc)
+        return RuntimeError("GitHub Trending 页面请求失败")
+
     def fetch(self, language: Optional[str], timeframe: str) -> List[TrendingHTMLRow]:
-        """抓取页面并转换为 TrendingHTMLRow 列表。"""
-        url = self._build_url(language, timeframe)
-        logger.debug("拉取 Trending 页面：%s", url)
-        try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as exc:
-            logger.error("请求 Trending 页面失败 %s：%s", url, exc)
-            raise RuntimeError("GitHub Trending 页面请求失败") from exc
-        return self._parse_html(response.text, language, timeframe)
-
-    def _parse_html(self, html: str, language: Optional[str], timeframe: str) -> List[TrendingHTMLRow]:
+        """抓取页面并转换为 TrendingHTMLRow 列表，命中缓存时跳过网络请求。"""
+        cache_key = self._cache_key(language, timeframe)
+        html = _cache_get(_PAGE_CACHE, cache_key)
+        if html is None:
+            url = self._build_url(language, timeframe)
+            logger.debug("拉取 Trending 页面：%s", url)
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+                response.raise_for_status()
+            except requests.exceptions.RequestException as exc:
+                raise self._request_error(url, exc) from exc
+            # 直接保留原始 UTF-8 字节交给 Lexbor，省去解码成 str 再编码回去的两次整页拷贝。
+            html = response.content
+            _cache_put(_PAGE_CACHE, cache_key, html)
+        return self._parse_html(html, language, timeframe)
+
+    async def fetch_async(self, language: Optional[str], timeframe: str) -> List[TrendingHTMLRow]:
+        """fetch 的异步版本，供 FastAPI 在事件循环上直接并发抓取多个语言。"""
+        cache_key = self._cache_key(language, timeframe)
+        html = _cache_get(_PAGE_CACHE, cache_key)
+        if html is None:
+            url = self._build_url(language, timeframe)
+            logger.debug("异步拉取 Trending 页面：%s", url)
+            try:
+                response = await self._get_async_client().get(url)
+                response.raise_for_status()
+            except httpx.HTTPError as exc:
+                raise self._request_error(url, exc) from exc
+            html = response.content
+            _cache_put(_PAGE_CACHE, cache_key, html)
+        return self._parse_html(html, language, timeframe)
+
+    def _parse_html(self, html: bytes | str, language: Optional[str], timeframe: str) -> List[TrendingHTMLRow]:
         """解析 HTML DOM，提取需要的字段。"""
-        soup = BeautifulSoup(html, "html.parser")
-        repo_sections = soup.select("article.Box-row")
+        # Lexbor 在 C 层完成解析与 CSS 选择，只为命中的节点创建 Python 对象。
+        tree = LexborHTMLParser(html)
+        repo_sections = tree.css(_ROW_SELECTOR)
+        headers = _group_by_row(tree.css(_HEADER_SELECTOR))
+        descriptions = _group_by_row(tree.css(_DESCRIPTION_SELECTOR))
+        languages = _group_by_row(tree.css(_LANGUAGE_SELECTOR))
+        stats = _group_by_row(tree.css(_STATS_SELECTOR))
+        deltas = [_group_by_row(tree.css(selector)) for selector in _DELTA_SELECTORS]
         results: List[TrendingHTMLRow] = []
         for idx, section in enumerate(repo_sections, start=1):
-            header = section.select_one("h2.h3 a")
+            row_id = section.mem_id
+            header = _first(headers, row_id)
             if not header:
                 continue
-            repo_identifier = header.get_text(strip=True).replace(" ", "")
+            repo_identifier = header.text(strip=True).replace(" ", "")
             if "/" not in repo_identifier:
                 continue
-            owner, name = [part.strip() for part in repo_identifier.split("/")[:2]]
+            owner, _, name = repo_identifier.partition("/")
+            owner = owner.strip()
+            name = name.strip()
             repo_url = f"https://github.com/{owner}/{name}"
-            description_el = section.select_one("p")
-            description = description_el.get_text(strip=True) if description_el else None
-            primary_language_el = section.select_one('[itemprop="programmingLanguage"]')
-            primary_language = primary_language_el.get_text(strip=True) if primary_language_el else None
-            stats_links = section.select("a.Link--muted")
+            description_el = _first(descriptions, row_id)
+            description = description_el.text(strip=True) if description_el else None
+            primary_language_el = _first(languages, row_id)
+            primary_language = primary_language_el.text(strip=True) if primary_language_el else None
+            stats_links = stats.get(row_id, ())
             total_stars = None
             forks = None
             for link in stats_links:
-                href = link.get("href", "")
+                href = link.attributes.get("href") or ""
                 if href.endswith("/stargazers"):
-                    total_stars = parse_int(link.get_text(strip=True))
-                elif any(segment in href for segment in ("/forks", "/network/members")):
-                    forks = parse_int(link.get_text(strip=True))
-            delta_el = section.select_one("span.d-inline-block.float-sm-right") or section.select_one("span.color-fg-muted.text-normal")
-            delta_text = delta_el.get_text(strip=True) if delta_el else None
+                    total_stars = parse_int(link.text(strip=True))
+                elif href.endswith(_FORK_HREF_SUFFIXES):
+                    forks = parse_int(link.text(strip=True))
+                if total_stars is not None and forks is not None:
+                    break
+            delta_el = _first(deltas[0], row_id) or _first(deltas[1], row_id)
+            delta_text = delta_el.text(strip=True) if delta_el else None
             stars_in_period = None
             if delta_text:
                 stars_in_period = parse_int(delta_text)
@@ -153,10 +619,6 @@ class TrendingPageClient:
             )
         return results
 
-    def close(self) -> None:
-        """关闭 HTTP 会话。"""
-        self.session.close()
-
 
 class TrendingService:
     """将 Trending 页面解析与 REST API 数据融合，输出标准结构。"""
@@ -164,24 +626,70 @@ class TrendingService:
     def __init__(self, token: Optional[str] = None) -> None:
         self.page_client = TrendingPageClient()
         self.api_client = GitHubAPIClient(token=token)
+        # 与异步客户端一样按需创建：close() 之后再次 fetch 时重新建池，service 可继续复用。
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
     def fetch(self, request: TrendingRequest) -> TrendingResponse:
         """执行抓取流程：校验参数 -> 抓取 -> 去重 -> 补全 -> 输出。"""
+        plan = self._plan(request)
+        executor = self._get_executor()
+        # 各语言页面互不依赖，交给线程池并发抓取；executor.map 保持 languages_to_fetch 的顺序。
+        pages = executor.map(
+            lambda language: self.page_client.fetch(language, plan.timeframe), plan.languages_to_fetch
+        )
+        self._select_rows(plan, dict(zip(plan.languages_to_fetch, pages)))
+        # 优先用 GraphQL 批量补全；未覆盖的仓库（无 token 或请求失败）再交给线程池并发走 REST。
+        metadata = self.api_client.fetch_repos_batch([(row.owner, row.name) for row in plan.rows])
+        missing = [row for row in plan.rows if row.key not in metadata]
+        fetched = executor.map(lambda row: self.api_client.fetch_repo(row.owner, row.name), missing)
+        metadata.update(zip((row.key for row in missing), fetched))
+        return self._build_response(plan, (metadata[row.key] for row in plan.rows))
+
+    async def fetch_async(self, request: TrendingRequest) -> TrendingResponse:
+        """fetch 的异步版本：页面与元数据请求都在事件循环上通过 asyncio.gather 并发发出。"""
+        plan = self._plan(request)
+        pages = await asyncio.gather(
+            *(self.page_client.fetch_async(language, plan.timeframe) for language in plan.languages_to_fetch)
+        )
+        self._select_rows(plan, dict(zip(plan.languages_to_fetch, pages)))
+        metadata = await self.api_client.fetch_repos_batch_async([(row.owner, row.name) for row in plan.rows])
+        missing = [row for row in plan.rows if row.key not in metadata]
+        # 与同步路径的线程池一样最多 API_MAX_WORKERS 个请求在途，后续请求能读到已更新的配额并一起退避。
+        semaphore = asyncio.Semaphore(API_MAX_WORKERS)
+
+        async def fetch_repo(row: TrendingHTMLRow) -> Optional[RepoMetadata]:
+            async with semaphore:
+                return await self.api_client.fetch_repo_async(row.owner, row.name)
+
+        fetched = await asyncio.gather(*(fetch_repo(row) for row in missing))
+        metadata.update(zip((row.key for row in missing), fetched))
+        return self._build_response(plan, (metadata[row.key] for row in plan.rows))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """返回补全用的线程池，尚未创建或已关闭时新建。"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=API_MAX_WORKERS, thread_name_prefix="github-api")
+            return self._executor
+
+    def _plan(self, request: TrendingRequest) -> FetchPlan:
+        """校验参数并计算需要抓取的语言与各项配额。"""
         timeframe = (request.timeframe or DEFAULT_TIMEFRAME).lower()
-        if timeframe not in SUPPORTED_TIMEFRAMES:
+        if timeframe not in SUPPORTED_TIMEFRAMES_SET:
             raise ValueError(f"不支持的时间窗口 '{request.timeframe}'，允许值：{SUPPORTED_TIMEFRAMES}")
         requested_limit = request.limit or DEFAULT_LIMIT
         if requested_limit <= 0:
             raise ValueError("limit 必须是正整数")
         per_language_limit = min(requested_limit, MAX_LIMIT)
-        normalized_languages = [lang.lower() for lang in request.languages if lang]
+        normalized_languages = [lang.strip().lower() for lang in request.languages if lang]
         languages_to_fetch: List[Optional[str]] = []
         if normalized_languages:
             if "all" in normalized_languages:
                 languages_to_fetch = [None]
             else:
                 for language in normalized_languages:
-                    if language not in CURATED_LANGUAGES:
+                    if language not in CURATED_LANGUAGES_SET:
                         raise ValueError(f"语言 '{language}' 不在策划的支持列表中")
                     languages_to_fetch.append(language)
         else:
@@ -190,28 +698,46 @@ class TrendingService:
         is_all_mode = len(languages_to_fetch) == 1 and languages_to_fetch[0] is None
         intended_total = per_language_limit if is_all_mode else per_language_limit * len(languages_to_fetch)
         overall_limit = min(intended_total, MAX_LIMIT if is_all_mode else MAX_LIMIT * len(languages_to_fetch))
-        remaining = overall_limit
+        return FetchPlan(
+            timeframe=timeframe,
+            normalized_languages=normalized_languages,
+            languages_to_fetch=languages_to_fetch,
+            requested_limit=requested_limit,
+            per_language_limit=per_language_limit,
+            is_all_mode=is_all_mode,
+            intended_total=intended_total,
+            overall_limit=overall_limit,
+        )
+
+    def _select_rows(
+        self,
+        plan: FetchPlan,
+        language_rows: Dict[Optional[str], List[TrendingHTMLRow]],
+    ) -> None:
+        """按语言顺序与配额去重各页面结果，写入 plan.rows。"""
+        languages_to_fetch = plan.languages_to_fetch
+        is_all_mode = plan.is_all_mode
+        per_language_limit = plan.per_language_limit
+        remaining = plan.overall_limit
         aggregated: "OrderedDict[str, TrendingHTMLRow]" = OrderedDict()
-        language_rows: Dict[Optional[str], List[TrendingHTMLRow]] = {}
-        for idx, language in enumerate(languages_to_fetch):
+        # 记录每种语言已入选的条数，补齐阶段无需再遍历 aggregated 统计。
+        taken_by_language: Dict[Optional[str], int] = defaultdict(int)
+        for language in languages_to_fetch:
             if remaining <= 0:
                 break
-            rows = self.page_client.fetch(language, timeframe)
-            language_rows[language] = rows
+            rows = language_rows[language]
             taken = 0
             for row in rows:
                 if not is_all_mode and taken >= per_language_limit:
                     break
-                key = f"{row.owner.lower()}/{row.name.lower()}"
-                if key in aggregated:
+                if row.key in aggregated:
                     continue
-                aggregated[key] = row
+                aggregated[row.key] = row
                 taken += 1
                 remaining -= 1
                 if remaining <= 0:
                     break
-            if len(languages_to_fetch) > 1 and not is_all_mode and remaining > 0 and idx < len(languages_to_fetch) - 1:
-                time.sleep(0.5)
+            taken_by_language[language] += taken
         # 第二轮用于补齐“配额不足”的语言，但仍会检查每种语言的上限，避免单一语言无限扩张。
         if remaining > 0 and not is_all_mode:
             for language in languages_to_fetch:
@@ -220,21 +746,28 @@ class TrendingService:
                 rows = language_rows.get(language)
                 if not rows:
                     continue
-                taken = sum(1 for row in aggregated.values() if row.language_context == language)
+                taken = taken_by_language[language]
                 for row in rows:
                     if taken >= per_language_limit:
                         break
-                    key = f"{row.owner.lower()}/{row.name.lower()}"
-                    if key in aggregated:
+                    if row.key in aggregated:
                         continue
-                    aggregated[key] = row
+                    aggregated[row.key] = row
                     taken += 1
                     remaining -= 1
                     if remaining <= 0:
                         break
+                taken_by_language[language] = taken
+        plan.rows = list(aggregated.values())[: plan.overall_limit]
+
+    def _build_response(
+        self,
+        plan: FetchPlan,
+        metadata_results: Iterable[Optional[RepoMetadata]],
+    ) -> TrendingResponse:
+        """将 Trending 行与对应的元数据合并为最终响应。"""
         repos: List[TrendingRepository] = []
-        for idx, row in enumerate(aggregated.values(), start=1):
-            metadata = self.api_client.fetch_repo(row.owner, row.name)
+        for idx, (row, metadata) in enumerate(zip(plan.rows, metadata_results), start=1):
             description = metadata.description if metadata and metadata.description else row.description
             repo_url = metadata.html_url if metadata and metadata.html_url else row.repo_url
             total_stars = metadata.stargazers_count if metadata and metadata.stargazers_count is not None else row.total_stars
@@ -242,7 +775,7 @@ class TrendingService:
             updated_at = metadata.updated_at if metadata else None
             # 当语言参数为 all 时，language_context 为空；此处尝试回填 primary_language 方便客户端识别。
             effective_language = row.language_context or row.primary_language
-            if effective_language is None and is_all_mode:
+            if effective_language is None and plan.is_all_mode:
                 effective_language = "all"
             repos.append(
                 TrendingRepository(
@@ -262,29 +795,37 @@ class TrendingService:
                     updated_at=updated_at,
                 )
             )
-            if len(repos) >= overall_limit:
-                break
         # metadata_block 中记录原始请求、有效配额与模式，方便客户端调试/展示。
         metadata_block: Dict[str, Any] = {
-            "timeframe": timeframe,
-            "languages": normalized_languages or ["all"],
+            "timeframe": plan.timeframe,
+            "languages": plan.normalized_languages or ["all"],
             "retrieved": len(repos),
-            "limit_mode": "shared" if is_all_mode else "per_language",
-            "requested_limit": requested_limit,
+            "limit_mode": "shared" if plan.is_all_mode else "per_language",
+            "requested_limit": plan.requested_limit,
         }
-        if is_all_mode:
-            metadata_block["limit"] = per_language_limit
+        if plan.is_all_mode:
+            metadata_block["limit"] = plan.per_language_limit
         else:
-            metadata_block["limit_per_language"] = per_language_limit
-            metadata_block["limit_total"] = intended_total
-        metadata_block["effective_limit"] = overall_limit
+            metadata_block["limit_per_language"] = plan.per_language_limit
+            metadata_block["limit_total"] = plan.intended_total
+        metadata_block["effective_limit"] = plan.overall_limit
         return TrendingResponse(repos=repos, metadata=metadata_block)
 
     def close(self) -> None:
-        """确保底层 HTTP 会话被释放。"""
+        """确保底层 HTTP 会话与线程池被释放，之后再次调用 fetch 会按需重建。"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
         self.page_client.close()
         self.api_client.close()
 
+    async def aclose(self) -> None:
+        """异步路径下的资源释放，额外关闭 HTTP/2 客户端。"""
+        await self.page_client.aclose()
+        await self.api_client.aclose()
+        self.close()
+
 def build_service_from_env() -> TrendingService:
     """从环境变量读取 token，构造带鉴权的服务实例。"""
     token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GITHUB_PAT")
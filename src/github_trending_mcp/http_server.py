@@ -4,17 +4,23 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
+import logging
 from typing import AsyncIterator, Callable, List, Optional
 
+import anyio
+import orjson
 from fastapi import FastAPI, HTTPException, Query
-from fastapi.concurrency import run_in_threadpool
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from .fetcher import TrendingService, build_service_from_env
 from .models import TrendingRequest
 from .validation import build_language_metadata, validate_inputs
 
+logger = logging.getLogger(__name__)
+
+# SSE 后台抓取与推送之间的缓冲条数，满了之后只保留最新数据。
+_STREAM_QUEUE_SIZE = 2
+
 
 def _split_languages(raw_languages: Optional[List[str]]) -> Optional[List[str]]:
     """支持 `?languages=python&languages=go` 或 `?languages=python,go` 形式。"""
@@ -30,17 +36,19 @@ def _split_languages(raw_languages: Optional[List[str]]) -> Optional[List[str]]:
     return normalized or None
 
 
-async def _run_fetch(service: TrendingService, request: TrendingRequest):
-    """将同步抓取封装成线程池调用，避免阻塞事件循环。"""
-
-    return await run_in_threadpool(service.fetch, request)
-
-
 def _format_sse(data: dict, event: str = "trending") -> str:
-    body = json.dumps(data, ensure_ascii=False)
+    # orjson 直接输出 UTF-8，中文无需额外转义。
+    body = orjson.dumps(data).decode()
     return f"event: {event}\ndata: {body}\n\n"
 
 
+def _put_latest(queue: "asyncio.Queue[Optional[str]]", message: Optional[str]) -> None:
+    """队列已满时丢弃最旧的消息，保证慢客户端拿到的总是最新数据。"""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(message)
+
+
 def _create_stream(
     service: TrendingService,
     request: TrendingRequest,
@@ -48,22 +56,45 @@ def _create_stream(
 ) -> AsyncIterator[str]:
     """根据 interval 确定是单次推送还是定期推送。"""
 
-    async def generator() -> AsyncIterator[str]:
+    async def producer(queue: "asyncio.Queue[Optional[str]]") -> None:
+        # 抓取在后台任务中按 interval 节奏进行，不受客户端消费速度影响；None 表示流结束。
         try:
             while True:
                 try:
-                    payload = await _run_fetch(service, request)
+                    payload = await service.fetch_async(request)
                 except RuntimeError as exc:
-                    yield _format_sse({"error": str(exc)}, event="error")
+                    _put_latest(queue, _format_sse({"error": str(exc)}, event="error"))
                     break
+                except Exception:
+                    # 非预期异常同样通知客户端，再抛出让 generator 记录日志，避免静默结束的空流。
+                    _put_latest(queue, _format_sse({"error": "抓取 GitHub Trending 时发生内部错误"}, event="error"))
+                    raise
                 else:
-                    yield _format_sse(payload.to_dict())
+                    _put_latest(queue, _format_sse(payload.to_dict()))
                 if interval is None:
                     break
-                # SSE 的刷新间隔完全由用户指定，附带 try/finally 以确保 service 释放。
                 await asyncio.sleep(interval)
         finally:
-            service.close()
+            _put_latest(queue, None)
+
+    async def generator() -> AsyncIterator[str]:
+        queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=_STREAM_QUEUE_SIZE)
+        task = asyncio.create_task(producer(queue))
+        try:
+            while True:
+                message = await queue.get()
+                if message is None:
+                    break
+                yield message
+        finally:
+            # 客户端断开时取消后台抓取，等待其退出后再释放 service。
+            task.cancel()
+            # 断开时 Starlette 会取消整个响应 scope，清理必须放在屏蔽取消的 scope 里才能执行完。
+            with anyio.CancelScope(shield=True):
+                await asyncio.gather(task, return_exceptions=True)
+                await service.aclose()
+            if not task.cancelled() and task.exception() is not None:
+                logger.exception("SSE 后台抓取异常终止", exc_info=task.exception())
 
     return generator()
 
@@ -95,19 +126,22 @@ def create_app(
         languages: Optional[List[str]] = Query(default=None, description="多值或逗号分隔"),
         limit: Optional[int] = Query(default=None, description="返回数量"),
         timeframe: Optional[str] = Query(default=None, description="时间窗口（daily/weekly/monthly）"),
-    ) -> dict:
+    ) -> Response:
         try:
             request = validate_inputs(_split_languages(languages), limit, timeframe)
         except ValueError as exc:  # 转换成 HTTP 400
             raise HTTPException(status_code=400, detail=str(exc)) from exc
         service = service_factory()
         try:
-            response = await _run_fetch(service, request)
-            return response.to_dict()
+            response = await service.fetch_async(request)
+            # 直接交给 orjson 编码为 bytes，跳过 FastAPI 的 jsonable_encoder 与标准库 json。
+            return Response(content=orjson.dumps(response.to_dict()), media_type="application/json")
         except RuntimeError as exc:
             raise HTTPException(status_code=502, detail=str(exc)) from exc
         finally:
-            service.close()
+            # 请求被取消（客户端断开）时同样要释放 service，见 _create_stream。
+            with anyio.CancelScope(shield=True):
+                await service.aclose()
 
     @app.get("/trending/stream")
     async def stream_trending(
@@ -23,6 +23,11 @@ class TrendingHTMLRow:
     period_text: Optional[str]
     repo_url: str
     timeframe: str
+    # 小写的 owner/name，作为跨语言去重的键，只在构造时计算一次。
+    key: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.key = f"{self.owner.lower()}/{self.name.lower()}"
 
 
 @dataclass(slots=True)
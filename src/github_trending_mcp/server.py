@@ -2,30 +2,61 @@
 
 from __future__ import annotations
 
-import argparse
-import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+import orjson
 
 from .constants import DEFAULT_LIMIT, DEFAULT_TIMEFRAME, SUPPORTED_TIMEFRAMES
-from .fetcher import build_service_from_env
+from .fetcher import TrendingService, build_service_from_env
 from .validation import build_language_metadata, validate_inputs
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:  # 仅用于类型注解，运行时由 _build_parser 按需导入
+    import argparse
+
+# FastMCP 在首次启动服务器时才导入，CLI 模式全程不会加载 mcp 包。
+FastMCPServer: Any = None
+
+
+def _load_fastmcp_server() -> Any:
+    """按需导入 FastMCPServer 并缓存到模块级，未安装 mcp 时返回 None。"""
+    global FastMCPServer
+    if FastMCPServer is None:
+        try:  # pragma: no cover - 尽力加载的可选依赖
+            try:
+                from mcp.server.fastmcp import FastMCPServer as server_cls  # type: ignore[attr-defined]
+            except ImportError:  # 若仅存在 FastMCP 类名则降级使用
+                from mcp.server.fastmcp import FastMCP as server_cls  # type: ignore
+        except Exception:  # pragma: no cover - 全量捕获避免运行期失败
+            return None
+        FastMCPServer = server_cls
+    return FastMCPServer
 
-try:  # pragma: no cover - 尽力加载的可选依赖
-    try:
-        from mcp.server.fastmcp import FastMCPServer  # type: ignore[attr-defined]
-    except ImportError:  # 若仅存在 FastMCP 类名则降级使用
-        from mcp.server.fastmcp import FastMCP as FastMCPServer  # type: ignore
-except Exception:  # pragma: no cover - 全量捕获避免运行期失败
-    FastMCPServer = None  # type: ignore
+
+# 进程内复用同一个 TrendingService，连接池与线程池只创建一次。
+_SERVICE: Optional[TrendingService] = None
+
+
+def _get_service() -> TrendingService:
+    """返回进程级共享的 TrendingService，首次调用时才构建。"""
+    global _SERVICE
+    if _SERVICE is None:
+        _SERVICE = build_service_from_env()
+    return _SERVICE
 
 
 def _format_json(data: Dict[str, Any]) -> str:
     """格式化 JSON，便于 CLI 或 TextContent 输出。"""
-    return json.dumps(data, ensure_ascii=False, indent=2)
+    # OPT_NON_STR_KEYS 保持与 json.dumps 一致：允许 int 等非字符串键。
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _is_clean_entry(entry: Any) -> bool:
+    """判断列表元素是否已是单个语言名：非空字符串且不含逗号或空白。"""
+    # isprintable() 为 False 的字符涵盖除 ASCII 空格外的所有空白，空格单独判断。
+    return isinstance(entry, str) and bool(entry) and "," not in entry and " " not in entry and entry.isprintable()
 
 
 def _parse_languages_argument(raw_languages: Optional[Any]) -> Optional[List[str]]:
@@ -35,13 +66,19 @@ def _parse_languages_argument(raw_languages: Optional[Any]) -> Optional[List[str
         return None
     normalized: List[str] = []
     def _split_entry(entry: str) -> List[str]:
+        # 不含逗号时直接按空白分割，省去 replace 产生的中间字符串。
+        if "," not in entry:
+            return entry.split()
         # 先统一把逗号替换为空格，再按空格分割，可兼容 "python,go" 与 "python go"。
-        replaced = entry.replace(",", " ")
-        return [segment.strip() for segment in replaced.split() if segment.strip()]
+        # split() 的结果已去除空白且不含空段，无需再逐段 strip。
+        return entry.replace(",", " ").split()
 
     if isinstance(raw_languages, str):
         candidates = _split_entry(raw_languages)
         return candidates or None
+    if isinstance(raw_languages, (list, tuple)) and all(_is_clean_entry(entry) for entry in raw_languages):
+        # 常见情况是客户端已传入 ["python", "go"]，无需逐项拆分。
+        return list(raw_languages) or None
     if isinstance(raw_languages, (list, tuple, set)):
         for entry in raw_languages:
             if not entry:
@@ -53,9 +90,9 @@ def _parse_languages_argument(raw_languages: Optional[Any]) -> Optional[List[str
     raise ValueError("languages 参数需要是字符串或字符串列表。")
 
 
-def _register_tools(server: "FastMCPServer") -> None:
+def _register_tools(server: Any) -> None:
     """在 FastMCPServer 上挂载工具实现。"""
-    service = build_service_from_env()
+    service = _get_service()
 
     @server.tool(
         name="fetch_trending_repositories",
@@ -69,6 +106,8 @@ def _register_tools(server: "FastMCPServer") -> None:
         parsed_languages = _parse_languages_argument(languages)
         request = validate_inputs(parsed_languages, limit, timeframe)
         response = service.fetch(request)
+        # 保持返回 dict：FastMCP 据此同时生成 structuredContent，
+        # 若预先序列化为 TextContent，客户端就只能拿到需要再解析的文本。
         return response.to_dict()
 
     @server.tool(
@@ -81,11 +120,14 @@ def _register_tools(server: "FastMCPServer") -> None:
 
 def run_server(args: argparse.Namespace) -> None:
     """启动 MCP 服务器，可切换 stdio、SSE 或 Streamable HTTP。"""
-    if FastMCPServer is None:
+    server_cls = _load_fastmcp_server()
+    if server_cls is None:
         raise RuntimeError(
             "运行 MCP 服务器需要先安装 'modelcontextprotocol'，可执行 `pip install modelcontextprotocol`。"
         )
-    logging.basicConfig(level=logging.INFO)
+    # 嵌入方或重复调用时若已配置过日志处理器，则不再覆盖。
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO)
     transport_security = None
     allowed_hosts = args.allowed_hosts or os.environ.get("MCP_ALLOWED_HOSTS")
     allowed_origins = args.allowed_origins or os.environ.get("MCP_ALLOWED_ORIGINS")
@@ -129,7 +171,7 @@ def run_server(args: argparse.Namespace) -> None:
             "MCP_AUTH_RESOURCE", "https://github-trending-mcp.local/resource"
         )
         auth_settings = AuthSettings(issuer_url=issuer, resource_server_url=resource_url)
-    server = FastMCPServer(
+    server = server_cls(
         "github-trending-repos-mcp",
         host=args.host,
         port=args.port,
@@ -147,76 +189,105 @@ def run_server(args: argparse.Namespace) -> None:
 
 def run_cli(args: argparse.Namespace) -> None:
     """在不接入 MCP 宿主时，直接打印 JSON 到终端。"""
-    service = build_service_from_env()
+    service = _get_service()
     parsed_languages = _parse_languages_argument(args.languages)
     request = validate_inputs(parsed_languages, args.limit, args.timeframe)
     response = service.fetch(request)
     print(_format_json(response.to_dict()))
 
 
-def build_arg_parser() -> argparse.ArgumentParser:
-    """构建统一的 CLI 参数解析器。"""
+# CLI 与服务器模式共用的参数定义：(flags, add_argument 关键字参数)。
+_COMMON_ARGUMENTS: Tuple[Tuple[Tuple[str, ...], Dict[str, Any]], ...] = (
+    (("--languages",), {"nargs": "*", "help": "筛选的语言列表（空格或逗号分隔）"}),
+    (("--limit",), {"type": int, "default": DEFAULT_LIMIT, "help": "需要返回的仓库数量"}),
+    (
+        ("--timeframe",),
+        {"default": DEFAULT_TIMEFRAME, "choices": SUPPORTED_TIMEFRAMES, "help": "GitHub Trending 使用的时间窗口"},
+    ),
+    (
+        ("--cli",),
+        {"action": "store_true", "help": "以 CLI 模式运行并直接输出 JSON，而非启动 MCP 服务器"},
+    ),
+)
+
+# 仅在启动 MCP 服务器时才需要注册的参数。
+_SERVER_ARGUMENTS: Tuple[Tuple[Tuple[str, ...], Dict[str, Any]], ...] = (
+    (
+        ("--transport",),
+        {"choices": ("stdio", "sse", "streamable-http"), "default": "stdio", "help": "运行 MCP 服务器时使用的传输协议"},
+    ),
+    (("--host",), {"default": "127.0.0.1", "help": "供 MCP HTTP 传输监听的主机地址"}),
+    (("--port",), {"type": int, "default": 8000, "help": "供 MCP HTTP 传输监听的端口"}),
+    (("--mount-path",), {"default": "/", "help": "SSE 传输的可选路径前缀（便于挂载到反向代理）"}),
+    (("--sse-path",), {"default": "/sse", "help": "供 MCP 客户端连接的 SSE 流路径"}),
+    (("--message-path",), {"default": "/messages/", "help": "SSE 传输使用的消息 POST 路径"}),
+    (
+        ("--streamable-http-path",),
+        {"default": "/mcp", "help": "使用 streamable-http 传输时的 HTTP Endpoint 路径"},
+    ),
+    (
+        ("--auth-token",),
+        {"help": "可选：启用 Bearer Token 鉴权时使用的固定令牌（也可通过 MCP_BEARER_TOKEN 环境变量）"},
+    ),
+    (
+        ("--allowed-hosts",),
+        {"help": "可选：限制访问的 Host 列表（逗号分隔），可用 MCP_ALLOWED_HOSTS 环境变量覆盖"},
+    ),
+    (
+        ("--allowed-origins",),
+        {"help": "可选：限制访问的 Origin 列表（逗号分隔），可用 MCP_ALLOWED_ORIGINS 环境变量覆盖"},
+    ),
+    (
+        ("--auth-issuer",),
+        {"help": "启用鉴权时用于 AuthSettings 的 issuer_url，可通过 MCP_AUTH_ISSUER 覆盖"},
+    ),
+    (
+        ("--auth-resource",),
+        {"help": "启用鉴权时用于 AuthSettings 的 resource_server_url，可通过 MCP_AUTH_RESOURCE 覆盖"},
+    ),
+)
+
+
+def _build_parser(
+    specs: Sequence[Tuple[Tuple[str, ...], Dict[str, Any]]],
+    hidden_specs: Sequence[Tuple[Tuple[str, ...], Dict[str, Any]]] = (),
+) -> argparse.ArgumentParser:
+    """按参数定义构建解析器，argparse 在真正需要时才导入。
+
+    hidden_specs 中的参数仍可被解析，但不出现在帮助中，也不会写入默认值。
+    """
+    import argparse
+
     parser = argparse.ArgumentParser(description="GitHub Trending MCP 服务器")
-    parser.add_argument("--languages", nargs="*", help="筛选的语言列表（空格或逗号分隔）")
-    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="需要返回的仓库数量")
-    parser.add_argument(
-        "--timeframe",
-        default=DEFAULT_TIMEFRAME,
-        choices=SUPPORTED_TIMEFRAMES,
-        help="GitHub Trending 使用的时间窗口",
-    )
-    parser.add_argument(
-        "--cli",
-        action="store_true",
-        help="以 CLI 模式运行并直接输出 JSON，而非启动 MCP 服务器",
-    )
-    parser.add_argument(
-        "--transport",
-        choices=("stdio", "sse", "streamable-http"),
-        default="stdio",
-        help="运行 MCP 服务器时使用的传输协议",
-    )
-    parser.add_argument("--host", default="127.0.0.1", help="供 MCP HTTP 传输监听的主机地址")
-    parser.add_argument("--port", type=int, default=8000, help="供 MCP HTTP 传输监听的端口")
-    parser.add_argument(
-        "--mount-path",
-        default="/",
-        help="SSE 传输的可选路径前缀（便于挂载到反向代理）",
-    )
-    parser.add_argument("--sse-path", default="/sse", help="供 MCP 客户端连接的 SSE 流路径")
-    parser.add_argument("--message-path", default="/messages/", help="SSE 传输使用的消息 POST 路径")
-    parser.add_argument(
-        "--streamable-http-path",
-        default="/mcp",
-        help="使用 streamable-http 传输时的 HTTP Endpoint 路径",
-    )
-    parser.add_argument(
-        "--auth-token",
-        help="可选：启用 Bearer Token 鉴权时使用的固定令牌（也可通过 MCP_BEARER_TOKEN 环境变量）",
-    )
-    parser.add_argument(
-        "--allowed-hosts",
-        help="可选：限制访问的 Host 列表（逗号分隔），可用 MCP_ALLOWED_HOSTS 环境变量覆盖",
-    )
-    parser.add_argument(
-        "--allowed-origins",
-        help="可选：限制访问的 Origin 列表（逗号分隔），可用 MCP_ALLOWED_ORIGINS 环境变量覆盖",
-    )
-    parser.add_argument(
-        "--auth-issuer",
-        help="启用鉴权时用于 AuthSettings 的 issuer_url，可通过 MCP_AUTH_ISSUER 覆盖",
-    )
-    parser.add_argument(
-        "--auth-resource",
-        help="启用鉴权时用于 AuthSettings 的 resource_server_url，可通过 MCP_AUTH_RESOURCE 覆盖",
-    )
+    for flags, options in specs:
+        parser.add_argument(*flags, **options)
+    for flags, options in hidden_specs:
+        parser.add_argument(*flags, **{**options, "help": argparse.SUPPRESS, "default": argparse.SUPPRESS})
     return parser
 
 
-def main() -> None:
+def build_cli_parser() -> argparse.ArgumentParser:
+    """构建 CLI 模式的参数解析器，帮助中只展示抓取相关参数。"""
+    # 服务器参数在 CLI 模式下无意义，但旧版本接受并忽略它们，此处隐藏注册以保持兼容。
+    return _build_parser(_COMMON_ARGUMENTS, hidden_specs=_SERVER_ARGUMENTS)
+
+
+def build_server_parser() -> argparse.ArgumentParser:
+    """构建 MCP 服务器模式的完整参数解析器。"""
+    return _build_parser(_COMMON_ARGUMENTS + _SERVER_ARGUMENTS)
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """构建统一的 CLI 参数解析器（等同于 build_server_parser，保留以兼容旧调用）。"""
+    return build_server_parser()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
     """根据 --cli 开关切换 CLI 或 MCP 运行模式。"""
-    parser = build_arg_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # 只有 --cli 决定使用哪套参数，直接扫描 argv 即可，CLI 模式不必注册服务器参数。
+    parser = build_cli_parser() if "--cli" in argv else build_server_parser()
+    args = parser.parse_args(argv)
     if args.cli:
         run_cli(args)
     else:
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
 # 过滤除数字外的所有字符，便于解析带单位的星标/增量。
 _NUMBER_CLEAN_RE = re.compile(r"[^0-9]")
+# 删除 Latin-1 范围内的非数字字符，str.translate 比正则替换快得多；更罕见的字符再交给正则兜底。
+_NON_DIGIT_TABLE = str.maketrans("", "", "".join(chr(code) for code in range(256) if not 48 <= code <= 57))
 
 
 def parse_int(value: Optional[str]) -> Optional[int]:
@@ -18,7 +20,13 @@ def parse_int(value: Optional[str]) -> Optional[int]:
 
     if not value:
         return None
-    cleaned = _NUMBER_CLEAN_RE.sub("", value)
+    # 常见格式是 "1,234"：去掉千分位后直接交给 C 实现的 int()，无需进入正则引擎。
+    compact = value.replace(",", "").strip()
+    if compact.isascii() and compact.isdigit():
+        return int(compact)
+    cleaned = value.translate(_NON_DIGIT_TABLE)
+    if not cleaned.isascii():
+        cleaned = _NUMBER_CLEAN_RE.sub("", cleaned)
     if not cleaned:
         return None
     try:
@@ -32,23 +40,3 @@ def snake_case(text: str) -> str:
     """简单的 snake_case 转换，当前暂未使用，保留以备扩展。"""
     return text.lower().replace(" ", "_")
 
-
-class LimitedOrderedDict(Dict[str, Any]):
-    """带容量限制的有序字典，用于去重时保留插入顺序。"""
-
-    def __init__(self, max_items: int) -> None:
-        super().__init__()
-        self._max_items = max_items
-
-    def add(self, key: str, value: Any) -> bool:
-        """若未超过容量则插入新的键值，返回是否成功。"""
-        if key in self:
-            return False
-        if len(self) >= self._max_items:
-            return False
-        self[key] = value
-        return True
-
-    def values_list(self) -> List[Any]:
-        """以列表形式返回当前的值集合。"""
-        return list(self.values())
@@ -6,10 +6,12 @@ from typing import Dict, List, Optional
 
 from .constants import (
     CURATED_LANGUAGES,
+    CURATED_LANGUAGES_SET,
     DEFAULT_LIMIT,
     DEFAULT_TIMEFRAME,
     MAX_LIMIT,
     SUPPORTED_TIMEFRAMES,
+    SUPPORTED_TIMEFRAMES_SET,
 )
 from .models import TrendingRequest
 
@@ -21,27 +23,40 @@ def validate_inputs(
 ) -> TrendingRequest:
     """校验语言/数量/时间窗口并转换成 TrendingRequest。"""
 
-    langs = languages or []
-    cleaned = [language.strip().lower() for language in langs if language]
     if limit is not None:
         if limit <= 0:
             raise ValueError("limit 必须大于 0")
         if limit > MAX_LIMIT:
             raise ValueError(f"limit 不可超过 {MAX_LIMIT}")
-    tf = (timeframe or DEFAULT_TIMEFRAME).lower()
-    if tf not in SUPPORTED_TIMEFRAMES:
-        raise ValueError(f"时间窗口必须属于 {SUPPORTED_TIMEFRAMES}")
-    for lang in cleaned:
-        if lang != "all" and lang not in CURATED_LANGUAGES:
-            raise ValueError(f"语言 '{lang}' 不在策划的支持列表中")
+    # 客户端通常已传入规范写法，命中集合时无需再生成小写副本。
+    tf = timeframe or DEFAULT_TIMEFRAME
+    if tf not in SUPPORTED_TIMEFRAMES_SET:
+        tf = tf.lower()
+        if tf not in SUPPORTED_TIMEFRAMES_SET:
+            raise ValueError(f"时间窗口必须属于 {SUPPORTED_TIMEFRAMES}")
+    # 标准化与校验合并为一次遍历。
+    cleaned: List[str] = []
+    for language in languages or ():
+        if not language:
+            continue
+        lang = language
+        if lang != "all" and lang not in CURATED_LANGUAGES_SET:
+            lang = language.strip().lower()
+            if lang != "all" and lang not in CURATED_LANGUAGES_SET:
+                raise ValueError(f"语言 '{lang}' 不在策划的支持列表中")
+        cleaned.append(lang)
     return TrendingRequest(languages=cleaned, limit=limit or DEFAULT_LIMIT, timeframe=tf)
 
 
+# 语言元数据导入时构建一次；值均为不可变对象（supported 是元组），浅拷贝即可隔离调用方的修改。
+_LANGUAGE_METADATA: Dict[str, object] = {
+    "default": "all",
+    "supported": CURATED_LANGUAGES,
+    "notes": "若未指定语言则默认抓取所有语言的 Trending。",
+}
+
+
 def build_language_metadata() -> Dict[str, object]:
     """提供语言默认值与支持列表，便于客户端展示。"""
 
-    return {
-        "default": "all",
-        "supported": tuple(CURATED_LANGUAGES),
-        "notes": "若未指定语言则默认抓取所有语言的 Trending。",
-    }
+    return dict(_LANGUAGE_METADATA)